@@ -5,7 +5,16 @@ from yakari.app import YakariApp
 
 
 @pytest.fixture
-def demo_app():
+def history_file(tmp_path, monkeypatch):
+    """Fixture pointing the arguments history at a temporary directory."""
+    path = tmp_path / "history.json"
+    monkeypatch.setattr("yakari.constants.HISTORY_FILE", path)
+    monkeypatch.setattr("yakari.constants.LEGACY_HISTORY_FILE", tmp_path / "history")
+    return path
+
+
+@pytest.fixture
+def demo_app(history_file):
     """Fixture providing a configured YakariApp instance."""
     # Get the absolute path to the demos.toml file
     yakari_root = Path(__file__).parent.parent
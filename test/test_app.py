@@ -107,3 +107,27 @@ async def test_multi_choice_argument(demo_app):
             "--multi-choice=jazz",
             "--multi-choice=npr news",
         ]
+
+
+@pytest.mark.asyncio
+async def test_multi_choice_argument_preselected(demo_app):
+    demo_app.menu.menus["a"].arguments["--mc"].selected = ["rock"]
+    async with demo_app.run_test() as pilot:
+        await pilot.press("a")
+        # an enabled argument is only opened in edit mode
+        await pilot.press("ctrl+e")
+        await pilot.press(*"--mc")
+        assert demo_app.screen.widget.selected == ["rock"]
+
+        # select "jazz"
+        await pilot.press("space")
+        await pilot.press("enter")
+        await pilot.press("d")
+
+        assert demo_app.command == [
+            "echo",
+            "--parent=100",
+            "--named-with-default=3",
+            "--multi-choice=rock",
+            "--multi-choice=jazz",
+        ]
@@ -0,0 +1,28 @@
+import shelve
+from unittest.mock import patch
+
+from yakari.history import load_history, save_history
+
+
+def test_history_round_trip(tmp_path):
+    path = tmp_path / "history.json"
+    history = {"--name": {"b": 1, "a": 1}}
+    save_history(history, path)
+
+    assert load_history(path) == history
+    assert list(load_history(path)["--name"]) == ["b", "a"]
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_history_imports_legacy_shelf(tmp_path):
+    legacy_path = tmp_path / "history"
+    with shelve.open(str(legacy_path)) as shelf:
+        shelf["--name"] = {"a": 1}
+
+    with patch("yakari.constants.LEGACY_HISTORY_FILE", legacy_path):
+        assert load_history(tmp_path / "history.json") == {"--name": {"a": 1}}
+
+
+def test_history_missing(tmp_path):
+    with patch("yakari.constants.LEGACY_HISTORY_FILE", tmp_path / "history"):
+        assert load_history(tmp_path / "history.json") == {}
@@ -0,0 +1,15 @@
+from yakari.trie import Trie
+
+
+def test_trie_find():
+    trie = Trie(["-f", "--flag", "a"])
+    assert trie.find("-f").terminal
+    assert not trie.find("-").terminal
+    assert trie.find("-x") is None
+    assert trie.find("") is trie.root
+
+
+def test_trie_node_keys():
+    trie = Trie(["-f", "--flag", "--fast", "a"])
+    assert trie.find("--").keys == ["--flag", "--fast"]
+    assert trie.find("").keys == ["-f", "--flag", "--fast", "a"]
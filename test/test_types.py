@@ -1,5 +1,16 @@
 import pytest
-from yakari.types import SuggestionsList, SuggestionsCommand
+from yakari.types import (
+    ChoiceArgument,
+    FlagArgument,
+    History,
+    Menu,
+    MenuArguments,
+    SuggestionsCommand,
+    SuggestionsList,
+    ValueArgument,
+    compile_template,
+    load_toml,
+)
 from unittest.mock import patch
 
 
@@ -38,6 +49,20 @@ class TestSuggestionsCommand:
         assert command_instance.values == ["line1", "line2"]
         assert mock_run.call_count == 2
 
+    @patch("subprocess.run")
+    def test_suggestions_caching_empty_output(self, mock_run, command_instance):
+        command_instance.cache = True
+        mock_run.return_value.stdout = b"\n"
+        mock_run.return_value.stderr = b""
+
+        assert command_instance.values == []
+        assert command_instance.values == []
+        mock_run.assert_called_once()
+
+        command_instance.clear_cache()
+        assert command_instance.values == []
+        assert mock_run.call_count == 2
+
     @patch("subprocess.run")
     def test_suggestions_with_error(self, mock_run, command_instance):
         mock_run.return_value.stderr = b"error message"
@@ -45,3 +70,115 @@ class TestSuggestionsCommand:
         with pytest.raises(RuntimeError) as exc_info:
             _ = command_instance.values
         assert "failed with the following message" in str(exc_info.value)
+
+
+def test_menu_arguments_include_exclude():
+    menu = Menu(
+        name="test",
+        arguments={
+            "-a": FlagArgument(flag="--a"),
+            "-b": FlagArgument(flag="--b"),
+            "-c": FlagArgument(flag="--c"),
+        },
+    )
+    assert list(MenuArguments(include="*").resolve_arguments(menu)) == [
+        "-a",
+        "-b",
+        "-c",
+    ]
+    assert list(
+        MenuArguments(include=["-a", "-b"], exclude=["-b"]).resolve_arguments(menu)
+    ) == ["-a"]
+
+
+def test_menu_arguments_scope():
+    root_flag = FlagArgument(flag="--root")
+    parent_flag = FlagArgument(flag="--parent")
+    own_flag = FlagArgument(flag="--own")
+    root = Menu(name="root", arguments={"-r": root_flag, "-a": root_flag})
+    parent = Menu(name="parent", arguments={"-a": parent_flag, "-b": parent_flag})
+    menu = Menu(name="test", arguments={"-b": own_flag, "-c": FlagArgument(flag="--c")})
+    parent._parent = root
+    menu._parent = parent
+
+    arguments = MenuArguments(include="*").resolve_arguments(menu)
+    assert list(arguments) == ["-r", "-a", "-b", "-c"]
+    assert arguments["-a"] is parent_flag
+    assert arguments["-b"] is own_flag
+
+    arguments = MenuArguments(include="*", scope="this").resolve_arguments(menu)
+    assert list(arguments) == ["-b", "-c"]
+
+
+def test_menu_arguments_kind_dispatch():
+    menu = Menu.model_validate(
+        {
+            "name": "test",
+            "arguments": {
+                "-f": {"flag": "--flag"},
+                "-c": {"name": "--choice", "choices": ["a", "b"]},
+                "-v": {"name": "--value"},
+            },
+            "commands": {
+                "r": {"name": "run", "template": ["run", {"include": "*"}]},
+            },
+        }
+    )
+    assert isinstance(menu.arguments["-f"], FlagArgument)
+    assert isinstance(menu.arguments["-c"], ChoiceArgument)
+    assert isinstance(menu.arguments["-v"], ValueArgument)
+    assert isinstance(menu.commands["r"].template[1], MenuArguments)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{self.flag}",
+        "--flag={self.flag}",
+        "{self.flag}-{self.description}!",
+        "{{literal}} {self.flag}",
+        "{self.flag!r}",
+        "{self.flag:>8}",
+        "no field",
+    ],
+)
+def test_compiled_template_matches_format(template):
+    argument = FlagArgument(flag="--flag", description="desc")
+    assert compile_template(template)(argument) == template.format(self=argument)
+
+
+def test_menu_candidates_are_cached():
+    menu = Menu.model_validate(
+        {
+            "name": "test",
+            "arguments": {"-a": {"flag": "--all"}},
+            "menus": {"s": {"name": "sub"}},
+            "commands": {"c": {"name": "cmd", "template": ["echo"]}},
+        }
+    )
+    assert list(menu.candidates) == ["-a", "s", "c"]
+    assert menu.candidates is menu.candidates
+    with pytest.raises(TypeError):
+        menu.candidates["x"] = None
+    assert menu.candidates_trie is menu.candidates_trie
+    assert menu.candidates_trie.find("-").keys == ["-a"]
+
+
+def test_history_add():
+    history = History(max_size=2)
+    for value in ["a", "b", "a", "c", ""]:
+        history.add(value)
+    assert list(history.values) == ["a", "c"]
+
+
+def test_menu_from_toml_reuses_parsed_file(tmp_path):
+    config_path = tmp_path / "menu.toml"
+    config_path.write_text('name = "test"\n[arguments]\n"-a" = { flag = "--all" }\n')
+    load_toml.cache_clear()
+
+    first = Menu.from_toml(config_path)
+    second = Menu.from_toml(config_path)
+    assert load_toml.cache_info().misses == 1
+    assert first is not second
+    first.arguments["-a"].on = True
+    assert not second.arguments["-a"].on
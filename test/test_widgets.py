@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from yakari.app import YakariApp
+from yakari.types import Menu
+from yakari.widgets import TagsCollection
+from yakari.widgets.command_runner import OUTPUT_DRAIN_DELAY
+
+
+def test_tags_collection():
+    tags = TagsCollection(["a", "b"])
+    assert tags.values == ["a", "b"]
+
+    tags.add_tag("c", "d")
+    tags.delete_tag(tags.tags[0])
+    tags.delete_tag("c")
+    assert tags.values == ["b", "d"]
+
+
+@pytest.mark.asyncio
+async def test_command_runner_background_child(history_file):
+    # the background child keeps the output pipes open after the command exits
+    template = ["sh", "-c", "echo hi; sleep 0.3; sleep 3 & exit 0"]
+    menu = Menu.model_validate(
+        {"name": "test", "commands": {"c": {"name": "cmd", "template": template}}}
+    )
+    app = YakariApp(menu, dry_run=False, inplace=True)
+    async with app.run_test() as pilot:
+        start = time.perf_counter()
+        await pilot.press("c")
+        runner = app.results_screen.cmd_runner
+        while runner._process_running:
+            await pilot.pause(0.05)
+            assert time.perf_counter() - start < OUTPUT_DRAIN_DELAY + 1.5
+
+        lines = [line.text for line in runner.log_widget.lines]
+        assert lines[1:3] == ["hi", "[Command finished (0)]"]
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from textual.app import App
 
+from .history import load_history, save_history
 from .types import Menu
 from .screens import MenuScreen, ResultsScreen
 
@@ -23,6 +24,9 @@ class YakariApp(App):
         self.command = None
         self.dry_run = dry_run
         self.inplace = inplace
+        # loaded once and shared by all the argument inputs, saved when the app exits
+        self.history = load_history()
+        self.history_changed = False
 
         match command_or_menu:
             case Menu():
@@ -36,3 +40,7 @@ class YakariApp(App):
         self.install_screen(self.results_screen, "results")
         self.install_screen(self.menu_screen, self.menu.name)
         self.push_screen(self.menu.name)
+
+    def on_unmount(self) -> None:
+        if self.history_changed:
+            save_history(self.history)
@@ -1,7 +1,7 @@
 import argparse
 import subprocess
 
-from .app import YakariApp
+from .types import Menu
 
 
 def main():
@@ -20,8 +20,13 @@ def main():
         help="When toggled, run the command in the original shell instead of within the Yakari menu.",
     )
     args = parser.parse_args()
+    menu = Menu.from_toml(args.command_name)
 
-    app = YakariApp(args.command_name, args.dry_run, not args.native)
+    # textual is slow to import, don't load it before the arguments and the menu
+    # are validated
+    from .app import YakariApp
+
+    app = YakariApp(menu, args.dry_run, not args.native)
     command = app.run()
     if command:
         subprocess.run(command)
@@ -4,13 +4,14 @@ from pathlib import Path
 # Menu constants
 DEFAULT_ARGUMENT_FIELDS = {"separator": "space", "multi_style": ","}
 
-DEFAULT_YAKARI_HOME = Path(os.environ["HOME"]) / ".config" / "yakari"
+DEFAULT_YAKARI_HOME = Path.home() / ".config" / "yakari"
 YAKARI_HOME = Path(os.environ.get("YAKARI_HOME", DEFAULT_YAKARI_HOME))
 
 MENUS_DIR = "menus"
 TEMPORARY_MENUS_DIR = "temporary_menus"
-HISTORY_FILENAME = "history"
+HISTORY_FILENAME = "history.json"
 HISTORY_FILE = YAKARI_HOME / HISTORY_FILENAME
+LEGACY_HISTORY_FILE = YAKARI_HOME / "history"
 
 REMOTE_DEFAULT = (
     "https://raw.githubusercontent.com/vlandeiro/yakari-menus/refs/heads/main"
@@ -0,0 +1,59 @@
+"""
+Persistence of the values entered for arguments, shared by all the input screens.
+"""
+
+import dbm
+import json
+import shelve
+from pathlib import Path
+from typing import Dict
+
+from . import constants as C
+
+
+ArgumentsHistory = Dict[str, Dict[str, int]]
+
+
+def load_history(path: Path | None = None) -> ArgumentsHistory:
+    """
+    Load the history of every argument.
+
+    Args:
+        path (Path | None): The JSON history file, defaults to `C.HISTORY_FILE`
+
+    Returns:
+        ArgumentsHistory: Past values mapped by argument name. When the JSON file does
+            not exist yet, the history saved with shelve by earlier versions is
+            imported, if any.
+    """
+    if path is None:
+        path = C.HISTORY_FILE
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        return {}
+
+    try:
+        with shelve.open(str(C.LEGACY_HISTORY_FILE), flag="r") as shelf:
+            return {name: dict(values) for name, values in shelf.items()}
+    except dbm.error:
+        return {}
+
+
+def save_history(history: ArgumentsHistory, path: Path | None = None):
+    """
+    Write the history of every argument.
+
+    The file is replaced atomically, so an interrupted write cannot corrupt it.
+
+    Args:
+        history (ArgumentsHistory): Past values mapped by argument name
+        path (Path | None): The JSON history file, defaults to `C.HISTORY_FILE`
+    """
+    if path is None:
+        path = C.HISTORY_FILE
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(history))
+    tmp_path.replace(path)
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import DefaultDict, List, Tuple
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Tuple
 
 from rich.padding import Padding
 from rich.style import Style
@@ -9,6 +9,7 @@ from rich.text import Text
 from .types import (
     Argument,
     ChoiceArgument,
+    Command,
     FlagArgument,
     Menu,
     Shortcut,
@@ -119,9 +120,7 @@ def render_key(key: str, user_input: str) -> Text:
     """
     if user_input:
         if key.startswith(user_input):
-            key = Text.assemble(
-                (user_input, HIGHLIGHT_STYLE), key.split(user_input, 1)[-1]
-            )
+            key = Text.assemble((user_input, HIGHLIGHT_STYLE), key[len(user_input) :])
         else:
             key = Text(key)
     return key
@@ -174,35 +173,73 @@ def render_arguments_group(
     return Padding(table, TABLE_PADDING)
 
 
-def render_menu(menu: Menu, user_input: str):
+class MenuLayout(NamedTuple):
     """
-    Generate a complete menu rendering including title, subcommands, arguments, and commands.
+    The entries of a menu, sorted and grouped for display.
+
+    The layout only depends on the menu structure, so it can be computed once and
+    reused to render the menu for every user input.
+
+    Attributes:
+        menus (List[Tuple[Shortcut, Menu]]): Sub-menus in display order
+        argument_groups (Dict[str, List[Tuple[Shortcut, Argument]]]): Arguments
+            grouped by name, each group in display order
+        commands (List[Tuple[Shortcut, Command]]): Commands in display order
+    """
+
+    menus: List[Tuple[Shortcut, Menu]]
+    argument_groups: Dict[str, List[Tuple[Shortcut, Argument]]]
+    commands: List[Tuple[Shortcut, Command]]
+
+
+def sort_items(items, sort_by_keys: bool) -> List[Tuple[Shortcut, Any]]:
+    if sort_by_keys:
+        return sorted(items, key=lambda x: x[0].lower())
+    return list(items)
+
+
+def layout_menu(menu: Menu) -> MenuLayout:
+    """
+    Sort and group the entries of a menu according to its configuration.
 
     Args:
-        menu (Menu): Menu object containing all elements to be rendered
+        menu (Menu): Menu object to lay out
+
+    Returns:
+        MenuLayout: The menu entries in display order
+    """
+    configuration = menu.configuration
+    return MenuLayout(
+        menus=sort_items(menu.menus.items(), configuration.sort_menus),
+        argument_groups={
+            group_name: sort_items(arguments, configuration.sort_arguments)
+            for group_name, arguments in group_arguments(menu.arguments).items()
+        },
+        commands=sort_items(menu.commands.items(), configuration.sort_commands),
+    )
+
+
+def render_menu_title(menu: Menu) -> Text:
+    return Text(menu.name, style="bold")
+
+
+def render_menu_sections(layout: MenuLayout, user_input: str):
+    """
+    Render the sections of a menu whose style depends on the user input.
+
+    Args:
+        layout (MenuLayout): Menu entries as returned by `layout_menu`
         user_input (str): Current user input string used for styling and filtering
-        sort_by_keys (bool): Whether to sort the entries by their keyboard shortcuts. Defaults to True.
 
     Yields:
-        Union[Text, Padding]: A sequence of Rich components representing different parts of the menu:
-            - Menu title as Text
-            - Subcommands table as Padding (if menu.menus exists)
-            - Argument groups as Padding (if menu.arguments exists)
-            - Commands table as Padding (if menu.commands exists)
-
-    Note:
-        Each section (subcommands, arguments, commands) is rendered in a separate table
-        with appropriate formatting and column configurations defined in TABLE_CONFIG
+        Padding: One table per section, in this order:
+            - Subcommands table (if the menu has sub-menus)
+            - Argument groups (if the menu has arguments)
+            - Commands table (if the menu has commands)
     """
-    yield Text(menu.name, style="bold")
-    if menu.menus:
+    if layout.menus:
         table = Table("key", "prefix", title="Subcommands", **TABLE_CONFIG)
-        menu_items = (
-            sorted(menu.menus.items(), key=lambda x: x[0].lower())
-            if menu.configuration.sort_menus
-            else menu.menus.items()
-        )
-        for key, prefix in menu_items:
+        for key, prefix in layout.menus:
             style = None
             if should_dim(key, user_input):
                 style = DIM_STYLE
@@ -210,17 +247,10 @@ def render_menu(menu: Menu, user_input: str):
             table.add_row(key, prefix.name, style=style)
         yield Padding(table, TABLE_PADDING)
 
-    if menu.arguments:
-        groups = group_arguments(menu.arguments)
-        for group_name, arguments in groups.items():
-            arguments = (
-                sorted(arguments, key=lambda x: x[0].lower())
-                if menu.configuration.sort_arguments
-                else arguments
-            )
-            yield render_arguments_group(group_name, arguments, user_input)
+    for group_name, arguments in layout.argument_groups.items():
+        yield render_arguments_group(group_name, arguments, user_input)
 
-    if menu.commands:
+    if layout.commands:
         table = Table(
             "key",
             "name",
@@ -228,15 +258,35 @@ def render_menu(menu: Menu, user_input: str):
             title="Commands",
             **TABLE_CONFIG,
         )
-        commands_items = (
-            sorted(menu.commands.items(), key=lambda x: x[0].lower())
-            if menu.configuration.sort_commands
-            else menu.commands.items()
-        )
-        for key, command in commands_items:
+        for key, command in layout.commands:
             style = None
             if should_dim(key, user_input):
                 style = DIM_STYLE
             key = render_key(key, user_input)
             table.add_row(key, command.name, command.description, style=style)
         yield Padding(table, TABLE_PADDING)
+
+
+def render_menu(menu: Menu, user_input: str):
+    """
+    Generate a complete menu rendering including title, subcommands, arguments, and commands.
+
+    Args:
+        menu (Menu): Menu object containing all elements to be rendered
+        user_input (str): Current user input string used for styling and filtering
+
+    Yields:
+        Union[Text, Padding]: A sequence of Rich components representing different parts of the menu:
+            - Menu title as Text
+            - Subcommands table as Padding (if menu.menus exists)
+            - Argument groups as Padding (if menu.arguments exists)
+            - Commands table as Padding (if menu.commands exists)
+
+    Note:
+        Each section (subcommands, arguments, commands) is rendered in a separate table
+        with appropriate formatting and column configurations defined in TABLE_CONFIG.
+        Callers rendering the same menu repeatedly should compute `layout_menu` once and
+        call `render_menu_sections` directly.
+    """
+    yield render_menu_title(menu)
+    yield from render_menu_sections(layout_menu(menu), user_input)
@@ -46,14 +46,11 @@ class ChoiceArgumentInputScreen(ModalScreen[int | List[str] | None]):
     def __init__(self, argument: ChoiceArgument):
         self.argument = argument
         if self.argument.multi:
-            selected = set()
-            if self.argument.selected:
-                selected = set(argument.selected)
-            selections = [
-                (choice, choice, True) if choice in selected else (choice, choice)
-                for choice in argument.choices
-            ]
-            self.widget = SelectionList(*selections, classes="input-widget")
+            selected = set(argument.selected or ())
+            self.widget = SelectionList(
+                *((choice, choice, choice in selected) for choice in argument.choices),
+                classes="input-widget",
+            )
             self.result_attr = "selected"
         else:
             self.widget = OptionList(*argument.choices, classes="input-widget")
@@ -1,5 +1,7 @@
+import shlex
 from typing import List, Literal
 
+from rich.console import Group
 from rich.text import Text
 from textual import events, work
 from textual.app import ComposeResult
@@ -10,7 +12,7 @@ from textual.widgets import (
     Static,
 )
 
-from ..rich_render import render_menu
+from ..rich_render import layout_menu, render_menu_sections, render_menu_title
 from ..types import (
     Argument,
     ChoiceArgument,
@@ -40,19 +42,41 @@ class MenuScreen(Screen):
         Binding("ctrl+r", "show_results", "show results"),
     ]
 
-    cur_input = reactive("", recompose=True)
-    edit_mode = reactive(False, recompose=True)
+    cur_input = reactive("", init=False)
+    edit_mode = reactive(False, init=False)
 
     def __init__(self, menu: Menu, is_entrypoint: bool = False):
         super().__init__()
         self.menu = menu
         self.is_entrypoint = is_entrypoint
-        self.candidates = {**menu.arguments, **menu.menus, **menu.commands}
+        self.candidates = menu.candidates
+        self.candidates_trie = menu.candidates_trie
+        self.menu_layout = layout_menu(menu)
+        # rendered sections for each input, cleared whenever an argument changes
+        self.sections_cache = {}
 
     def compose(self) -> ComposeResult:
-        for renderable in render_menu(self.menu, self.cur_input):
-            yield Static(renderable)
-        yield Footer()
+        yield Static(render_menu_title(self.menu))
+        self.menu_sections = Static(self.render_sections())
+        yield self.menu_sections
+        self.footer = Footer()
+        yield self.footer
+
+    def render_sections(self) -> Group:
+        """Render the menu sections for the current input, reusing previous renders."""
+        sections = self.sections_cache.get(self.cur_input)
+        if sections is None:
+            sections = Group(*render_menu_sections(self.menu_layout, self.cur_input))
+            self.sections_cache[self.cur_input] = sections
+        return sections
+
+    def watch_cur_input(self):
+        """Update the rendered menu in place rather than recomposing the screen."""
+        self.menu_sections.update(self.render_sections())
+        self.footer.update_input()
+
+    def watch_edit_mode(self):
+        self.footer.update_mode(self.edit_mode)
 
     @work
     async def action_show_results(self):
@@ -82,15 +106,14 @@ class MenuScreen(Screen):
             self.cur_input = match_results.partial_matches[0]
             await self.process_match(self.candidates[self.cur_input])
 
-    @work
-    async def on_key(self, event: events.Key) -> None:
+    def on_key(self, event: events.Key) -> None:
         """Handle key press events.
 
         Args:
             event (events.Key): The key press event
 
         Handles printable characters by:
-        - Processing exact matches immediately
+        - Processing exact matches in a worker, as they may wait on modal screens
         - Adding character to input if there are partial matches
         - Resetting input if no matches
         """
@@ -103,7 +126,7 @@ class MenuScreen(Screen):
             # If we have an exact match, then process it
             if match_results.exact_match is not None:
                 self.cur_input = new_input
-                await self.process_match(self.candidates[new_input])
+                self.run_worker(self.process_match(self.candidates[new_input]))
                 event.stop()
 
             # If we have partial matches, then we update the current
@@ -152,6 +175,7 @@ class MenuScreen(Screen):
         match argument:
             case FlagArgument():
                 argument.on = not argument.on
+                self.sections_cache.clear()
                 self.cur_input = ""
             case ChoiceArgument():
 
@@ -162,6 +186,7 @@ class MenuScreen(Screen):
                         argument.selected = [value]
                     else:
                         argument.selected = value
+                    self.sections_cache.clear()
                     self.cur_input = ""
 
                 if argument.selected and action == "toggle":
@@ -175,6 +200,7 @@ class MenuScreen(Screen):
 
                 def set_argument_value_and_reset_input(value: str):
                     argument.value = value
+                    self.sections_cache.clear()
                     self.cur_input = ""
 
                 if argument.value is not None and action == "toggle":
@@ -208,11 +234,10 @@ class MenuScreen(Screen):
             return
 
         results_widget: CommandRunner = self.app.results_screen.cmd_runner
-        command_str = " ".join(self.app.command)
-
         inplace = command.inplace if command.inplace is not None else self.app.inplace
 
         if self.app.dry_run:
+            command_str = shlex.join(self.app.command)
             if inplace:
                 self.app.push_screen("results")
                 results_widget.write(Text(f"$> {command_str}"))
@@ -225,7 +250,9 @@ class MenuScreen(Screen):
                 results_widget.start_subprocess(self.app.command)
             else:
                 self.app.exit(
-                    result=self.app.command, return_code=0, message=command_str
+                    result=self.app.command,
+                    return_code=0,
+                    message=shlex.join(self.app.command),
                 )
 
     async def process_menu(self, menu: Menu):
@@ -234,7 +261,7 @@ class MenuScreen(Screen):
         Args:
             menu (Menu): The submenu to display
         """
-        menu._ancestors_arguments = self.menu.arguments
+        menu._parent = self.menu
         await self.app.push_screen_wait(MenuScreen(menu))
         self.cur_input = ""
 
@@ -247,11 +274,12 @@ class MenuScreen(Screen):
         Returns:
             MatchResult: Contains exact and partial matches found
         """
-        candidates_set = set(self.candidates)
+        node = self.candidates_trie.find(s)
         exact_match = None
         partial_matches = []
-        if s in candidates_set:
-            exact_match = s
-        else:
-            partial_matches = [key for key in candidates_set if key.startswith(s)]
+        if node is not None:
+            if node.terminal:
+                exact_match = s
+            else:
+                partial_matches = list(node.keys)
         return MatchResult(exact_match=exact_match, partial_matches=partial_matches)
@@ -1,10 +1,6 @@
-import shelve
-
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
-from textual.widgets import OptionList
 
-from .. import constants as C
 from ..types import ValueArgument
 from ..widgets import ArgumentInput, Footer, SuggestionsWidget
 
@@ -25,7 +21,7 @@ class ValueArgumentInputScreen(ModalScreen[str | None]):
         self.argument = argument
         self._init_suggestions()
         self.input_widget = ArgumentInput(
-            argument, self.suggested_values, classes="input-widget"
+            argument, self.suggested_completions, classes="input-widget"
         )
         self.input_widget.border_title = argument.name
 
@@ -35,9 +31,8 @@ class ValueArgumentInputScreen(ModalScreen[str | None]):
 
         # Load suggestions from history
         if not self.argument.password:
-            with shelve.open(C.HISTORY_FILE, writeback=True) as shelf:
-                arg_history = shelf.get(self.argument.name, dict())
-                self.suggested_values.extend(list(arg_history)[::-1])
+            arg_history = self.app.history.get(self.argument.name, {})
+            self.suggested_values.extend(reversed(arg_history))
 
         # Load suggestions from hard-coded list, executed command, or other methods
         if self.argument.suggestions:
@@ -45,6 +40,9 @@ class ValueArgumentInputScreen(ModalScreen[str | None]):
                 self.suggested_values.append(None)
             self.suggested_values.extend(self.argument.suggestions.values)
 
+        # None separates the history from the other suggestions in the widget, and
+        # is left out of the input completions
+        self.suggested_completions = [value for value in self.suggested_values if value]
         if self.suggested_values:
             self.suggestions_widget = SuggestionsWidget(
                 self.suggested_values, classes="input-widget"
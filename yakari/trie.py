@@ -0,0 +1,72 @@
+"""
+A prefix tree used to match user input against menu shortcuts.
+"""
+
+from typing import Dict, Iterable, List
+
+
+class TrieNode:
+    """
+    A node of the shortcut prefix tree.
+
+    Attributes:
+        children (Dict[str, TrieNode]): Child nodes indexed by their character
+        terminal (bool): True when the path leading to this node is a full shortcut
+        keys (List[str]): All the shortcuts found in this node's subtree, in insertion
+            order
+    """
+
+    __slots__ = ("children", "terminal", "keys")
+
+    def __init__(self):
+        self.children: Dict[str, TrieNode] = {}
+        self.terminal: bool = False
+        self.keys: List[str] = []
+
+
+class Trie:
+    """
+    A prefix tree built once from a collection of shortcuts.
+
+    Looking up a string walks one node per character, so the cost of a lookup
+    depends on the length of the input rather than on the number of shortcuts.
+    Each node also stores the shortcuts of its subtree, so listing completions
+    does not require traversing the tree.
+
+    Args:
+        keys (Iterable[str]): The shortcuts to index
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self.root = TrieNode()
+        for key in keys:
+            self.insert(key)
+
+    def insert(self, key: str):
+        node = self.root
+        node.keys.append(key)
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+            node = child
+            node.keys.append(key)
+        node.terminal = True
+
+    def find(self, prefix: str) -> TrieNode | None:
+        """
+        Walk the tree along `prefix`.
+
+        Args:
+            prefix (str): The string to look up
+
+        Returns:
+            TrieNode | None: The node reached after consuming `prefix`, or None if no
+                shortcut starts with `prefix`
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
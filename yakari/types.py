@@ -4,17 +4,42 @@ This module provides classes to represent actions, commands, command groups,
 and complete menu structures in a type-safe way using Pydantic data validation.
 """
 
+import functools
+import string
 import subprocess
-import urllib
-import urllib.request
+import sys
+import tomllib
+import urllib.parse
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Awaitable, Callable, Dict, List, Literal, Self
-
-import tomlkit
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Self,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    Tag,
+    model_validator,
+)
 
 from . import constants as C
+from .trie import Trie
 
 
 Shortcut = str
@@ -24,12 +49,18 @@ class YakariType(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-class History(YakariType):
-    """A class managing command history with navigation capabilities."""
+@dataclass(slots=True)
+class History:
+    """
+    A class managing the history of values entered for an argument.
+
+    Attributes:
+        values (Dict[str, int]): Past values, ordered from oldest to most recent
+        max_size (int): Maximum number of values to keep
+    """
 
-    values: Dict[str, int] = Field(default_factory=dict)
+    values: Dict[str, int] = field(default_factory=dict)
     max_size: int = 20
-    _cur_pos: int | None = PrivateAttr(default=None)
 
     def add(self, value: str):
         if not value:
@@ -40,11 +71,12 @@ class History(YakariType):
         self.values[value] = 1
 
         if len(self.values) > self.max_size:
-            first_key = list(self.values.keys())[0]
-            del self.values[first_key]
+            # dicts keep insertion order, so the first key is the oldest value
+            del self.values[next(iter(self.values))]
 
 
-class MatchResult(YakariType):
+@dataclass(slots=True)
+class MatchResult:
     """
     Represents the result of a command/argument matching operation.
 
@@ -54,7 +86,51 @@ class MatchResult(YakariType):
     """
 
     exact_match: str | None = None
-    partial_matches: List[str] = Field(default_factory=list)
+    partial_matches: List[str] = field(default_factory=list)
+
+
+@functools.cache
+def compile_template(template: str) -> Callable[[Any], str]:
+    """
+    Compile an argument template into a function rendering it for an argument.
+
+    Templates only made of literals and plain `{self.<attribute>}` fields are
+    parsed once and rendered by concatenating the literals with the formatted
+    attributes. Any other template falls back to `str.format`.
+
+    Args:
+        template (str): The python format string to compile
+
+    Returns:
+        Callable[[Any], str]: A function taking the argument and returning the
+            rendered string
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(
+        template
+    ):
+        attribute = None
+        if field_name is not None:
+            attribute = field_name.removeprefix("self.")
+            is_plain_field = (
+                field_name.startswith("self.")
+                and attribute.isidentifier()
+                and not format_spec
+                and conversion is None
+            )
+            if not is_plain_field:
+                return lambda argument: template.format(self=argument)
+        parts.append((literal, attribute))
+
+    def render(argument: Any) -> str:
+        return "".join(
+            literal
+            if attribute is None
+            else literal + format(getattr(argument, attribute))
+            for literal, attribute in parts
+        )
+
+    return render
 
 
 class Argument(YakariType):
@@ -84,9 +160,9 @@ class Argument(YakariType):
     def render_template(self) -> List[str] | str:
         match self.template:
             case list():
-                return [part.format(self=self) for part in self.template]
+                return [compile_template(part)(self) for part in self.template]
             case str():
-                return self.template.format(self=self)
+                return compile_template(self.template)(self)
             case _:
                 return
 
@@ -206,23 +282,32 @@ class SuggestionsList(YakariType):
 class SuggestionsCommand(YakariType):
     command: str
     cache: bool = False
-    _suggestions: List[str] = PrivateAttr(default_factory=list)
+    _suggestions: List[str] | None = PrivateAttr(default=None)
 
     @property
     def values(self):
-        if not self.cache or not self._suggestions:
-            result = subprocess.run(self.command, capture_output=True, shell=True)
-            if result.stderr:
-                raise RuntimeError(
-                    f"Command {self.command} failed with the following "
-                    f"message:\n{result.stderr.decode()}"
-                )
-            self._suggestions = [
-                line.strip()
-                for line in result.stdout.decode().split("\n")
-                if line.strip()
-            ]
-        return self._suggestions
+        # None rather than an empty list marks the cache as unset, so a command
+        # without output is not run again
+        if self.cache and self._suggestions is not None:
+            return self._suggestions
+
+        result = subprocess.run(self.command, capture_output=True, shell=True)
+        if result.stderr:
+            raise RuntimeError(
+                f"Command {self.command} failed with the following "
+                f"message:\n{result.stderr.decode()}"
+            )
+        suggestions = [
+            line.decode()
+            for line in map(bytes.strip, result.stdout.splitlines())
+            if line
+        ]
+        if self.cache:
+            self._suggestions = suggestions
+        return suggestions
+
+    def clear_cache(self):
+        self._suggestions = None
 
 
 SuggestionsImpl = SuggestionsList | SuggestionsCommand
@@ -257,7 +342,36 @@ class ValueArgument(NamedArgument):
         return self.value
 
 
-ArgumentImpl = FlagArgument | ValueArgument | ChoiceArgument
+def get_argument_kind(value: Any) -> str:
+    """
+    Identify which argument class should validate a value.
+
+    Arguments have no explicit kind in the configuration: a flag argument is
+    the only one defining `flag` and a choice argument the only one defining
+    `choices`. Dispatching on these keys lets pydantic validate against a
+    single class instead of trying each member of the union in turn.
+
+    Args:
+        value: A raw configuration dict or an already instantiated argument
+
+    Returns:
+        str: The tag of the argument class to use
+    """
+    match value:
+        case FlagArgument() | {"flag": _}:
+            return "flag"
+        case ChoiceArgument() | {"choices": _}:
+            return "choice"
+        case _:
+            return "value"
+
+
+ArgumentImpl = Annotated[
+    Annotated[FlagArgument, Tag("flag")]
+    | Annotated[ValueArgument, Tag("value")]
+    | Annotated[ChoiceArgument, Tag("choice")],
+    Discriminator(get_argument_kind),
+]
 
 
 class MenuArguments(YakariType):
@@ -266,25 +380,18 @@ class MenuArguments(YakariType):
     scope: Literal["this"] | Literal["all"] = "all"
 
     def resolve_arguments(self, menu: "Menu") -> Dict[Shortcut, Argument]:
-        arguments = dict()
+        arguments = menu.arguments
         if self.scope == "all":
-            arguments.update(menu._ancestors_arguments)
-        arguments.update(menu.arguments)
-
-        if self.include != "*":
-            arguments = {
-                shortcut: arg
-                for shortcut, arg in arguments.items()
-                if shortcut in self.include
-            }
-        if self.exclude:
-            arguments = {
-                shortcut: arg
-                for shortcut, arg in arguments.items()
-                if shortcut not in self.exclude
-            }
+            # closer menus shadow their ancestors' arguments, without merging copies
+            arguments = ChainMap(*(m.arguments for m in menu.lineage()))
 
-        return arguments
+        include = None if self.include == "*" else set(self.include)
+        exclude = set(self.exclude or ())
+        return {
+            shortcut: arg
+            for shortcut, arg in arguments.items()
+            if (include is None or shortcut in include) and shortcut not in exclude
+        }
 
 
 CommandTemplate = List[str | MenuArguments | ArgumentImpl]
@@ -325,7 +432,7 @@ class MenuConfiguration(YakariType):
 
 def set_default_arg_value(arg: Argument, configuration: MenuConfiguration):
     config_fields_set = configuration.named_arguments_style.model_fields_set
-    arg_fields = arg.model_fields
+    arg_fields = type(arg).model_fields
     arg_fields_set = arg.model_fields_set
     for field_name in config_fields_set:
         if field_name in arg_fields and field_name not in arg_fields_set:
@@ -334,6 +441,24 @@ def set_default_arg_value(arg: Argument, configuration: MenuConfiguration):
     return arg
 
 
+@functools.lru_cache(maxsize=32)
+def load_toml(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a TOML file, reusing the previous result while the file is unchanged.
+
+    Args:
+        path (Path): Resolved path of the file to parse
+        mtime_ns (int): Modification time of the file, part of the cache key so that
+            edited files are parsed again
+
+    Returns:
+        Dict[str, Any]: The parsed document. It is shared between calls and must not
+            be mutated.
+    """
+    with path.open("rb") as fd:
+        return tomllib.load(fd)
+
+
 class Menu(YakariType):
     """
     Represents the complete menu structure containing groups of commands.
@@ -351,7 +476,38 @@ class Menu(YakariType):
     commands: Dict[Shortcut, Command] = Field(default_factory=dict)
     configuration: MenuConfiguration = Field(default_factory=MenuConfiguration)
 
-    _ancestors_arguments: Dict[Shortcut, Argument] = PrivateAttr(default_factory=dict)
+    _parent: Self | None = PrivateAttr(default=None)
+
+    def lineage(self) -> Iterator[Self]:
+        """Yield this menu, then each menu it was opened from up to the entrypoint."""
+        menu = self
+        while menu is not None:
+            yield menu
+            menu = menu._parent
+
+    @functools.cached_property
+    def candidates(self) -> Mapping[Shortcut, ArgumentImpl | Self | Command]:
+        """
+        All the entries of this menu mapped by their interned shortcuts.
+
+        Menus are not modified after loading, so this is computed on the first
+        visit and shared, read-only, by every screen showing this menu afterwards.
+        """
+        return MappingProxyType(
+            {
+                sys.intern(key): value
+                for key, value in {
+                    **self.arguments,
+                    **self.menus,
+                    **self.commands,
+                }.items()
+            }
+        )
+
+    @functools.cached_property
+    def candidates_trie(self) -> Trie:
+        """A prefix tree over the shortcuts of `candidates`."""
+        return Trie(self.candidates)
 
     @classmethod
     def from_toml(cls, command_name: str | Path) -> Self:
@@ -359,29 +515,32 @@ class Menu(YakariType):
             config_path = command_name
 
         elif command_name.startswith(("http://", "https://")):  # url
+            # urllib.request pulls http.client and email, only pay for it when
+            # a remote menu is requested
+            from urllib.request import urlretrieve
+
             # resolve the URL to a local path
             url = command_name
             parsed_url = urllib.parse.urlparse(url)
             filename = urllib.parse.unquote(Path(parsed_url.path).name)
             config_path = C.YAKARI_HOME / C.TEMPORARY_MENUS_DIR / filename
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            urllib.request.urlretrieve(url, config_path)
+            urlretrieve(url, config_path)
 
         else:  # command name
             base_path = C.YAKARI_HOME / C.MENUS_DIR
             config_path = (base_path / command_name).with_suffix(".toml")
 
-        if not (
-            config_path.exists() and config_path.is_file()
-        ):  # no local configuration exists
+        if not config_path.is_file():  # no local configuration exists
             try:
                 # try to retrieve an online configuration
                 return cls.from_toml(f"{C.REMOTE_DEFAULT}/{command_name}.toml")
             except Exception:
                 raise ValueError(f"No configuration found for '{command_name}'.")
 
-        with config_path.open("r") as fd:
-            model = tomlkit.load(fd).unwrap()
+        # validation builds a new Menu from the shared document, so callers never
+        # share argument state
+        model = load_toml(config_path.resolve(), config_path.stat().st_mtime_ns)
         return cls.model_validate(model)
 
     @model_validator(mode="after")
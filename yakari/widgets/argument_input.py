@@ -1,12 +1,9 @@
-import shelve
-
 from textual.app import ComposeResult
 from textual.message import Message
 from textual.suggester import SuggestFromList
 from textual.widget import Widget
 from textual.widgets import Input as BaseInput
 
-from .. import constants as C
 from ..types import Argument, History
 from .tags import TagsCollection
 
@@ -37,7 +34,7 @@ class ArgumentInput(Widget):
 
         suggester = None
         if suggested_values:
-            suggester = SuggestFromList(list(filter(None, suggested_values)))
+            suggester = SuggestFromList(suggested_values)
         self.input_widget = Input(
             password=argument.password,
             suggester=suggester,
@@ -52,13 +49,11 @@ class ArgumentInput(Widget):
 
     def on_mount(self):
         if self.with_history:
-            self.shelf = shelve.open(C.HISTORY_FILE, writeback=True)
-            self.history = History(values=self.shelf.get(self.argument.name, dict()))
+            self.history = History(values=self.app.history.get(self.argument.name, {}))
 
     def on_unmount(self):
         if self.with_history:
-            self.shelf[self.argument.name] = self.history.values
-            self.shelf.close()
+            self.app.history[self.argument.name] = self.history.values
 
     def set_value(self, value: str):
         self.input_widget.value = value
@@ -74,6 +69,7 @@ class ArgumentInput(Widget):
     def on_input_submitted(self, event: Input.Submitted):
         if self.input_widget.value and self.with_history:
             self.history.add(self.input_widget.value)
+            self.app.history_changed = True
 
         if self.argument.multi:
             if not self.input_widget.value:
@@ -1,13 +1,22 @@
 import asyncio
+import codecs
+import shlex
 from typing import List
 
 from rich.text import Text
 from textual import work
 from textual.app import ComposeResult
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Input, RichLog
 
+# delay given to the output readers to reach the end of the pipes once the command
+# exits
+OUTPUT_DRAIN_DELAY = 0.5
+# interval at which the command is checked for exit
+EXIT_POLL_DELAY = 0.05
+
 
 class CommandRunner(Widget):
     can_focus_children = True
@@ -24,13 +33,13 @@ class CommandRunner(Widget):
         self.log_widget.can_focus = False
         self.user_input = Input(placeholder="Interact with your command")
         self.subprocess: asyncio.subprocess.Process | None = None
-        self.extra_stdout: bytes = b""
-        self.extra_stdout_lock = asyncio.Lock()
+        self.pending_output: List[Text] = []
+        self.flush_timer: Timer | None = None
 
     @work
     async def start_subprocess(self, command: List[str]):
         """Start the subprocess and stream its output."""
-        self.log_widget.write(Text(f"$> {' '.join(command)}"))
+        self.log_widget.write(Text(f"$> {shlex.join(command)}"))
         try:
             # Start the subprocess
             self._process_running = True
@@ -42,15 +51,31 @@ class CommandRunner(Widget):
             )
 
             # Stream the subprocess output
-            asyncio.create_task(self.stream_stdout(self.subprocess.stdout))
-            asyncio.create_task(self.stream_stderr(self.subprocess.stderr))
-            asyncio.create_task(self.extra_stdout_watcher())
-
-            # Wait for the process to finish and display the final message once
-            return_code = await self.subprocess.wait()
+            output_tasks = [
+                asyncio.create_task(self.stream_output(self.subprocess.stdout)),
+                asyncio.create_task(
+                    self.stream_output(self.subprocess.stderr, style="red")
+                ),
+            ]
+
+            # Wait for the process to finish and display the final message once,
+            # after the rest of its output. A background child may keep the pipes
+            # open, which also holds back `wait()`, so the exit is detected from
+            # the return code and the readers only get a short delay to reach the
+            # end of the pipes.
+            while self.subprocess.returncode is None:
+                await asyncio.sleep(EXIT_POLL_DELAY)
+            return_code = self.subprocess.returncode
+            _, pending = await asyncio.wait(output_tasks, timeout=OUTPUT_DRAIN_DELAY)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                # release the pipes still held open by the background children
+                self.subprocess._transport.close()
 
             if self._process_running:  # Only show this once
-                self.log_widget.write(
+                self.write(
                     Text(
                         f"[Command finished ({return_code})]\n",
                         style="red" if return_code else "green",
@@ -62,52 +87,68 @@ class CommandRunner(Widget):
         except Exception as e:
             self.log_widget.write(Text(f"Error: {e}"))
 
-    async def extra_stdout_watcher(self):
-        SLEEP = 0.1
-
-        while self.subprocess is not None:
-            async with self.extra_stdout_lock:
-                extra_before = self.extra_stdout
-
-            await asyncio.sleep(SLEEP)
-
-            async with self.extra_stdout_lock:
-                extra_after = self.extra_stdout
-                if extra_before and extra_before == extra_after:
-                    self.log_widget.write(Text(self.extra_stdout.decode()))
-                    self.extra_stdout = b""
-
-    async def stream_stderr(self, stream):
-        while not stream.at_eof():
-            payload = await stream.readline()
-            self.log_widget.write(Text(payload.decode(), style="red"))
-
-    async def stream_stdout(self, stream):
+    async def stream_output(self, stream, style: str = ""):
         """Continuously read lines from the given stream and display them."""
-        READSIZE = 2048
-
-        while not stream.at_eof():
-            payload = await stream.read(READSIZE)
-            payload, *extra = payload.rsplit(b"\n", 1)
-
-            async with self.extra_stdout_lock:
-                payload = self.extra_stdout + payload
-                self.log_widget.write(Text(payload.decode().strip()))
+        READSIZE = 16384
+        # delay after which a line without end, e.g. a prompt, is displayed anyway
+        PARTIAL_LINE_DELAY = 0.1
 
-            if extra:
-                async with self.extra_stdout_lock:
-                    self.extra_stdout = extra[0]
-            else:
-                payload = b""
-                async with self.extra_stdout_lock:
-                    self.extra_stdout = b""
+        # the decoder keeps characters split between two reads intact
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        partial_line = []
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        stream.read(READSIZE),
+                        PARTIAL_LINE_DELAY if partial_line else None,
+                    )
+                except TimeoutError:
+                    self.enqueue_output(Text("".join(partial_line), style=style))
+                    partial_line.clear()
+                    continue
+                if not payload:
+                    break
+
+                *lines, rest = decoder.decode(payload).split("\n")
+                if lines:
+                    lines[0] = "".join(partial_line) + lines[0]
+                    partial_line.clear()
+                    for line in lines:
+                        self.enqueue_output(Text(line, style=style))
+                if rest:
+                    partial_line.append(rest)
+        finally:
+            # the output may not end with a new line, or the reader may be cancelled
+            # before reaching the end of the stream
+            partial_line.append(decoder.decode(b"", final=True))
+            if tail := "".join(partial_line):
+                self.enqueue_output(Text(tail, style=style))
+
+    def enqueue_output(self, text: Text):
+        """Queue subprocess output, to be written to the log with the next batch."""
+        FLUSH_DELAY = 0.05
+
+        self.pending_output.append(text)
+        if self.flush_timer is None:
+            self.flush_timer = self.set_timer(FLUSH_DELAY, self.flush_output)
+
+    def flush_output(self):
+        """Write the queued subprocess output to the log."""
+        if self.flush_timer is not None:
+            self.flush_timer.stop()
+            self.flush_timer = None
+        if self.pending_output:
+            # a single write renders and refreshes the log once for the whole batch
+            self.log_widget.write(Text("\n").join(self.pending_output))
+            self.pending_output.clear()
 
     async def send_input(self, user_input: str):
         """Send user input to the subprocess."""
         if self.subprocess and self.subprocess.stdin:
             self.subprocess.stdin.write(user_input.encode() + b"\n")
             await self.subprocess.stdin.drain()
-            self.log_widget.write(f"\nU> {user_input}")
+            self.write(f"\nU> {user_input}")
 
     async def action_terminate_subprocess(self):
         if self.subprocess:
@@ -121,6 +162,8 @@ class CommandRunner(Widget):
         self.user_input.value = ""
 
     def write(self, *args, **kwargs):
+        # keep the queued output ahead of direct writes
+        self.flush_output()
         self.log_widget.write(*args, **kwargs)
 
     def compose(self) -> ComposeResult:
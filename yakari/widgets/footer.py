@@ -5,6 +5,11 @@ from textual.widgets import Label
 
 
 class Footer(BaseFooter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.input_label: Label | None = None
+        self.mode_label: Label | None = None
+
     def _get_full_input(self) -> str:
         inputs = []
         for screen in self.app.screen_stack:
@@ -12,13 +17,29 @@ class Footer(BaseFooter):
                 inputs.append(screen.cur_input)
         return inputs
 
+    def _render_input(self) -> str:
+        return " > ".join(self._get_full_input())
+
+    def update_input(self):
+        """Show the current input without recomposing the footer."""
+        if self.input_label is not None:
+            self.input_label.update(self._render_input())
+
+    def _render_mode(self, edit_mode: bool) -> str:
+        hint = "edit" if edit_mode else "toggle"
+        return f"Mode: {hint}"
+
+    def update_mode(self, edit_mode: bool):
+        """Show the current mode without recomposing the footer."""
+        if self.mode_label is not None:
+            self.mode_label.update(self._render_mode(edit_mode))
+
     def compose(self) -> ComposeResult:
         if not self._bindings_ready:
             return
 
-        inputs = self._get_full_input()
-
-        yield Label(" > ".join(inputs), id="cur-input")
+        self.input_label = Label(self._render_input(), id="cur-input")
+        yield self.input_label
 
         labels = [Label("Shortcuts:", classes="title")]
         bindings = [
@@ -32,5 +53,5 @@ class Footer(BaseFooter):
         yield Horizontal(*labels, id="help-section")
 
         edit_mode = getattr(self.app.screen, "edit_mode", None)
-        hint = "edit" if edit_mode else "toggle"
-        yield Label(f"Mode: {hint}", id="hint-edit")
+        self.mode_label = Label(self._render_mode(edit_mode), id="hint-edit")
+        yield self.mode_label
@@ -16,16 +16,11 @@ class SuggestionsWidget(Widget):
             self.value = value
             super().__init__()
 
-    def __init__(self, suggested_values: list[str], *args, **kwargs):
+    def __init__(self, suggested_values: list[str | None], *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.suggested_values = list(filter(None, suggested_values))
-        fmt_suggested_values = [
-            Option(value)
-            for value in suggested_values
-        ]
-
+        # OptionList renders None as a separator
         self.suggestions_widget = OptionList(
-            *fmt_suggested_values,
+            *(value if value is None else Option(value) for value in suggested_values),
             id="suggestions",
         )
         self.suggestions_widget.border_title = "Suggested values"
@@ -1,16 +1,21 @@
+from rich.text import Text
+from textual import events
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import Button, Label
 
 
 class Tag(Widget):
+    """A value rendered with a delete button, drawn as a single renderable."""
+
     can_focus = True
-    can_focus_children = False
 
-    value: reactive[str] = reactive(str, recompose=True)
+    COMPONENT_CLASSES = {"tag--delete"}
+    DELETE_GLYPH = " X "
+
+    value: reactive[str] = reactive(str)
 
     BINDINGS = [
         ("backspace", "delete_this", "delete"),
@@ -25,15 +30,18 @@ class Tag(Widget):
         super().__init__()
         self.value = value
 
-    def compose(self) -> ComposeResult:
-        yield Button("X")
-        yield Label(self.value)
+    def render(self) -> Text:
+        return Text.assemble(
+            (self.DELETE_GLYPH, self.get_component_rich_style("tag--delete")),
+            f" {self.value} ",
+        )
 
     def delete(self):
         self.post_message(Tag.Deleted(self))
 
-    def on_button_pressed(self, event: Button.Pressed):
-        self.delete()
+    def on_click(self, event: events.Click):
+        if event.x < len(self.DELETE_GLYPH):
+            self.delete()
 
     def action_delete_this(self):
         self.delete()
@@ -52,20 +60,21 @@ class TagsCollection(Widget):
 
     def __init__(self, tags: list[str | Tag] | None = None):
         super().__init__()
-        if self.tags:
+        if tags:
             self.tags = [self._sanitize_tag(tag) for tag in tags]
-            self.mutate_reactive(TagsCollection.tags)
 
     def add_tag(self, *tags: str | Tag):
-        for tag in tags:
-            tag = self._sanitize_tag(tag)
-            self.tags.append(tag)
-        self.mutate_reactive(TagsCollection.tags)
+        if not tags:
+            return
+        # a new list recomposes the collection once for all the added tags
+        self.tags = [*self.tags, *map(self._sanitize_tag, tags)]
 
     def delete_tag(self, tag: str | Tag):
-        tag = self._sanitize_tag(tag)
-        self.tags.remove(tag)
-        self.mutate_reactive(TagsCollection.tags)
+        self.tags = [
+            existing
+            for existing in self.tags
+            if existing is not tag and existing.value != tag
+        ]
 
     def on_tag_deleted(self, message: Tag.Deleted):
         self.delete_tag(message.tag)